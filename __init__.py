@@ -1,29 +1,30 @@
 """Example of a custom component exposing a service."""
 from __future__ import annotations
 
+# Imported first: it records when the package import started.
+from . import api
+
+import importlib
 import logging
+import time
 
 from datetime import timedelta
-import requests
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.typing import ConfigType
-from huawei_lte_api.Client import Client
-from huawei_lte_api.Connection import Connection
-from urllib3.exceptions import InsecureRequestWarning
 
-requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
+from .api import get_client, get_connection
+from .burst import SignalBurst
+from .const import CONF_PASSWORD, CONF_URL, CONF_USERNAME, DOMAIN
 
-# The domain of your component. Should be equal to the name of your component.
-DOMAIN = "huawei_service_sync"
 _LOGGER = logging.getLogger(__name__)
 
-CONF_URL = "url"
-CONF_USERNAME = "username"
-CONF_PASSWORD = "password"
+PLATFORMS = ["sensor", "text", "button"]
 
 SERVICE_SEND_SMS = "send_sms"
 ATTR_PHONE = "phone"
@@ -33,6 +34,36 @@ SEND_SMS_SCHEMA = vol.Schema(
     {vol.Required(ATTR_PHONE): cv.string, vol.Required(ATTR_MESSAGE): cv.string}
 )
 
+SERVICE_START_SIGNAL_BURST = "start_signal_burst"
+SERVICE_STOP_SIGNAL_BURST = "stop_signal_burst"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_DURATION = "duration"
+ATTR_INTERVAL = "interval"
+
+START_SIGNAL_BURST_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=120): vol.All(vol.Coerce(int), vol.Range(min=5, max=900)),
+        vol.Optional(ATTR_INTERVAL, default=1.0): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=10)),
+    }
+)
+
+STOP_SIGNAL_BURST_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTRY_ID): cv.string})
+
+SERVICE_PROFILE_REFRESHES = "profile_refreshes"
+ATTR_REFRESHES = "refreshes"
+ATTR_ALLOCATIONS = "allocations"
+# Extra seconds on top of the expected refresh time before a profile is cut short.
+PROFILE_GRACE_PERIOD = 120
+
+PROFILE_REFRESHES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_REFRESHES, default=5): vol.All(vol.Coerce(int), vol.Range(min=1, max=50)),
+        vol.Optional(ATTR_ALLOCATIONS, default=True): cv.boolean,
+    }
+)
+
 
 CONFIG_SCHEMA = vol.Schema(
     {
@@ -47,17 +78,17 @@ CONFIG_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
-def create_session():
-    session = requests.Session()
-    session.verify = False
-    return session
-
 class HuaweiDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Huawei Router data."""
 
     def __init__(self, hass, entry):
         """Initialize."""
         self.entry = entry
+        self.signal_burst = SignalBurst(hass, entry)
+        # Filled in by async_setup_entry once the platforms are set up.
+        self.setup_timings = None
+        # Set by the profile_refreshes service while a profile is being taken.
+        self.profiler = None
         super().__init__(
             hass,
             _LOGGER,
@@ -67,15 +98,12 @@ class HuaweiDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self):
         """Fetch data from API."""
+        profiler = self.profiler
+        started = time.perf_counter()
+
         def _fetch():
-            url = self.entry.data[CONF_URL]
-            username = self.entry.data[CONF_USERNAME]
-            password = self.entry.data[CONF_PASSWORD]
-            scheme, host = url.split("://", 1) if "://" in url else ("http", url)
-            
-            session = create_session()
-            with Connection(f"{scheme}://{username}:{password}@{host}/", requests_session=session) as connection:
-                client = Client(connection)
+            with get_connection(self.entry.data) as connection:
+                client = get_client(connection)
                 return {
                     "device_information": client.device.information(),
                     "dhcp_settings": client.dhcp.settings(),
@@ -85,17 +113,57 @@ class HuaweiDataUpdateCoordinator(DataUpdateCoordinator):
                     "lan_host_info": client.lan.host_info(),
                 }
 
+        if profiler is not None:
+            _fetch = profiler.wrap(_fetch)
+
         try:
             return await self.hass.async_add_executor_job(_fetch)
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}")
+        finally:
+            # Failed refreshes count too: the listeners may not run after them.
+            if profiler is not None:
+                profiler.durations.append(time.perf_counter() - started)
+                if profiler.async_refresh_done():
+                    # Deferred so the state writes of this refresh are still profiled.
+                    self.hass.loop.call_soon(self.async_finish_profiling, profiler)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners, profiling the entity state writes when requested."""
+        profiler = self.profiler
+        if profiler is None:
+            super().async_update_listeners()
+            return
+
+        with profiler.profile():
+            super().async_update_listeners()
+
+    @callback
+    def async_finish_profiling(self, profiler=None) -> None:
+        """Stop profiling and write the report of what was collected so far."""
+        if self.profiler is None or (profiler is not None and profiler is not self.profiler):
+            return
+        profiler, self.profiler = self.profiler, None
+        if profiler.cancel_deadline is not None:
+            profiler.cancel_deadline()
+        self.hass.async_create_task(profiler.async_finish())
+
+def _import_platforms() -> float:
+    """Import the platform modules and return how long it took, in seconds."""
+    started = time.perf_counter()
+    for platform in PLATFORMS:
+        importlib.import_module(f"{__name__}.{platform}")
+    return time.perf_counter() - started
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up from a config entry."""
     hass.data.setdefault(DOMAIN, {})
     
+    started = time.perf_counter()
     coordinator = HuaweiDataUpdateCoordinator(hass, entry)
     await coordinator.async_config_entry_first_refresh()
+    refreshed = time.perf_counter()
     
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
@@ -103,31 +171,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not hass.services.has_service(DOMAIN, 'get_info'):
         _register_services(hass, entry.data)
 
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor", "text", "button"])
+    # Already-imported modules are cached, so reloads report close to zero here.
+    platform_import = await hass.async_add_executor_job(_import_platforms)
+    platforms_started = time.perf_counter()
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    coordinator.setup_timings = {
+        "first_refresh_ms": round((refreshed - started) * 1000, 1),
+        "platform_import_ms": round(platform_import * 1000, 1),
+        "platform_setup_ms": round((time.perf_counter() - platforms_started) * 1000, 1),
+    }
+    _LOGGER.debug("Startup timings for %s: %s", entry.data[CONF_URL], coordinator.setup_timings)
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor", "text", "button"])
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.signal_burst.async_stop()
+        coordinator.async_finish_profiling()
     return unload_ok
 
 def _register_services(hass: HomeAssistant, conf: dict):
-    def get_connection():
-        url = conf[CONF_URL]
-        username = conf[CONF_USERNAME]
-        password = conf[CONF_PASSWORD]
-        scheme, host = url.split("://", 1) if "://" in url else ("http", url)
-        session = create_session()
-        return Connection(f"{scheme}://{username}:{password}@{host}/", requests_session=session)
-
     async def get_info(call: ServiceCall) -> None:
         """Get router information."""
         def _fetch():
             """Fetch information from the router."""
-            with get_connection() as connection:
-                client = Client(connection)
+            with get_connection(conf) as connection:
+                client = get_client(connection)
                 return client.device.information()
 
         info = await hass.async_add_executor_job(_fetch)
@@ -148,8 +220,8 @@ def _register_services(hass: HomeAssistant, conf: dict):
 
         def _send() -> str | None:
             """Send the SMS and return an error message on failure."""
-            with get_connection() as connection:
-                client = Client(connection)
+            with get_connection(conf) as connection:
+                client = get_client(connection)
                 try:
                     client.sms.send_sms(phone_numbers=[phone], message=message)
                     _LOGGER.info("SMS sent to %s", phone)
@@ -171,13 +243,78 @@ def _register_services(hass: HomeAssistant, conf: dict):
                 {"title": "Huawei Router SMS", "message": f"SMS sent to {phone}"}
             )
 
+    def get_coordinator(call: ServiceCall) -> HuaweiDataUpdateCoordinator:
+        """Return the coordinator of the requested router, or the first one."""
+        coordinators = hass.data.get(DOMAIN, {})
+        entry_id = call.data.get(ATTR_ENTRY_ID)
+        if entry_id is None and coordinators:
+            return next(iter(coordinators.values()))
+        if entry_id not in coordinators:
+            raise HomeAssistantError(f"No Huawei router configured with entry id {entry_id}")
+        return coordinators[entry_id]
+
+    async def start_signal_burst(call: ServiceCall) -> None:
+        """Sample only the signal metrics at a high rate for a limited time."""
+        coordinator = get_coordinator(call)
+        await coordinator.signal_burst.async_start(call.data[ATTR_DURATION], call.data[ATTR_INTERVAL])
+
+    async def stop_signal_burst(call: ServiceCall) -> None:
+        """Stop a running signal burst."""
+        await get_coordinator(call).signal_burst.async_stop()
+
+    async def profile_refreshes(call: ServiceCall) -> None:
+        """Profile the next refreshes and state writes of a router."""
+        from .profiler import RefreshProfiler
+
+        coordinator = get_coordinator(call)
+        if coordinator.profiler is not None:
+            raise HomeAssistantError("A profile is already being taken for this router")
+
+        profiler = RefreshProfiler(
+            hass, coordinator.entry, call.data[ATTR_REFRESHES], call.data[ATTR_ALLOCATIONS]
+        )
+        # Claim the slot before awaiting so a second call is refused.
+        coordinator.profiler = profiler
+        try:
+            await hass.async_add_executor_job(profiler.start)
+        except Exception:
+            coordinator.profiler = None
+            raise
+        if coordinator.profiler is not profiler:
+            # The entry was unloaded meanwhile and the report is already written.
+            return
+
+        @callback
+        def _deadline_reached(_now) -> None:
+            _LOGGER.warning(
+                "Profiling did not see %d refreshes in time, writing a partial report",
+                profiler.refreshes,
+            )
+            coordinator.async_finish_profiling(profiler)
+
+        # Unreachable routers may refresh less often than expected, never profile forever.
+        timeout = call.data[ATTR_REFRESHES] * coordinator.update_interval.total_seconds() + PROFILE_GRACE_PERIOD
+        profiler.cancel_deadline = async_call_later(hass, timeout, _deadline_reached)
+        await coordinator.async_request_refresh()
+
     # Register our service with Home Assistant.
     hass.services.async_register(DOMAIN, 'get_info', get_info)
     hass.services.async_register(
         DOMAIN, SERVICE_SEND_SMS, send_sms, schema=SEND_SMS_SCHEMA
     )
+    hass.services.async_register(
+        DOMAIN, SERVICE_START_SIGNAL_BURST, start_signal_burst, schema=START_SIGNAL_BURST_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_STOP_SIGNAL_BURST, stop_signal_burst, schema=STOP_SIGNAL_BURST_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE_REFRESHES, profile_refreshes, schema=PROFILE_REFRESHES_SCHEMA
+    )
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the sync service example component."""
     # Return true to allow UI setup
     return True
+
+api.integration_import_duration = time.perf_counter() - api.package_import_started
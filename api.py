@@ -0,0 +1,102 @@
+"""Client building for the Huawei web API.
+
+``requests``, ``urllib3`` and ``huawei_lte_api`` are only imported the first
+time a client is needed, so loading the integration (and rendering the config
+flow) stays cheap.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+import logging
+import time
+from types import SimpleNamespace
+
+from .const import CONF_PASSWORD, CONF_URL, CONF_USERNAME
+
+_LOGGER = logging.getLogger(__name__)
+
+# __init__ imports this module first, so this marks the start of the package import.
+package_import_started = time.perf_counter()
+# Seconds spent importing the integration package, set at the end of __init__.
+integration_import_duration = None
+# Seconds spent importing the client libraries, None until they are loaded.
+client_import_duration = None
+
+
+class InvalidAuth(Exception):
+    """Error to indicate the router rejected the credentials."""
+
+
+class CannotConnect(Exception):
+    """Error to indicate the router could not be reached."""
+
+
+class TooManyAttempts(Exception):
+    """Error to indicate the router locked the login after failed attempts."""
+
+
+@lru_cache(maxsize=None)
+def _lib():
+    """Import the client libraries once and silence TLS warnings."""
+    global client_import_duration
+    started = time.perf_counter()
+
+    import requests
+    from huawei_lte_api.Client import Client
+    from huawei_lte_api.Connection import Connection
+    from huawei_lte_api import exceptions
+    from urllib3.exceptions import InsecureRequestWarning
+
+    requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
+
+    client_import_duration = time.perf_counter() - started
+    _LOGGER.debug("Loaded Huawei client libraries in %.1f ms", client_import_duration * 1000)
+    return SimpleNamespace(
+        requests=requests, Client=Client, Connection=Connection, exceptions=exceptions
+    )
+
+
+def split_url(url):
+    """Return (scheme, host) for a router URL, defaulting to http."""
+    return url.split("://", 1) if "://" in url else ("http", url)
+
+
+def create_session():
+    session = _lib().requests.Session()
+    session.verify = False
+    return session
+
+
+def get_connection(conf, timeout=None):
+    """Log in to the router described by a config entry's data."""
+    lib = _lib()
+    scheme, host = split_url(conf[CONF_URL])
+    username = conf[CONF_USERNAME]
+    password = conf[CONF_PASSWORD]
+    return lib.Connection(
+        f"{scheme}://{username}:{password}@{host}/",
+        requests_session=create_session(),
+        timeout=timeout,
+    )
+
+
+def get_client(connection):
+    return _lib().Client(connection)
+
+
+def validate_login(conf):
+    """Log in once and return the device name reported by the router."""
+    lib = _lib()
+    try:
+        with get_connection(conf, timeout=10) as connection:
+            return get_client(connection).device.information().get("DeviceName")
+    except (
+        lib.exceptions.LoginErrorUsernameWrongException,
+        lib.exceptions.LoginErrorPasswordWrongException,
+        lib.exceptions.LoginErrorUsernamePasswordWrongException,
+    ) as err:
+        raise InvalidAuth from err
+    except lib.exceptions.LoginErrorUsernamePasswordOverrunException as err:
+        raise TooManyAttempts from err
+    except lib.requests.exceptions.RequestException as err:
+        raise CannotConnect from err
@@ -0,0 +1,166 @@
+"""High-frequency signal sampling used while aligning antennas."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import logging
+import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .api import get_client, get_connection
+from .const import CONF_URL, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+SIGNAL_METRICS = ("rsrp", "rsrq", "sinr", "rssi")
+BUFFER_SIZE = 600
+MAX_CONSECUTIVE_ERRORS = 5
+
+
+def parse_signal_value(value):
+    """Return a signal reading such as '>=-51dBm' as a float, or None."""
+    if value is None:
+        return None
+    try:
+        return float(str(value).upper().replace('DBM', '').replace('DB', '').replace('>=', '').strip())
+    except ValueError:
+        return None
+
+
+def burst_signal_name(entry_id):
+    """Return the dispatcher signal fired for each burst sample."""
+    return f"{DOMAIN}_signal_burst_{entry_id}"
+
+
+class SignalBurst:
+    """Poll only device.signal over one session for a limited time."""
+
+    def __init__(self, hass: HomeAssistant, entry):
+        self.hass = hass
+        self.entry = entry
+        self.samples = deque(maxlen=BUFFER_SIZE)
+        self.ends_at = None
+        self._task = None
+
+    @property
+    def active(self):
+        return self._task is not None and not self._task.done()
+
+    async def async_start(self, duration, interval):
+        """Start a burst, or extend the running one to the new duration.
+
+        Raises HomeAssistantError when the router login fails.
+        """
+        self.ends_at = time.time() + duration
+        if self.active:
+            return
+        self.samples.clear()
+        ready = self.hass.loop.create_future()
+        self._task = self.hass.async_create_background_task(
+            self._async_run(interval, ready), f"{DOMAIN} signal burst {self.entry.entry_id}"
+        )
+        await ready
+
+    async def async_stop(self):
+        """Stop the running burst, if any."""
+        if not self.active:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def _async_login(self):
+        connection = await self.hass.async_add_executor_job(get_connection, self.entry.data, 5)
+        return connection, get_client(connection)
+
+    async def _async_close(self, connection):
+        try:
+            await self.hass.async_add_executor_job(connection.close)
+        except Exception as err:
+            _LOGGER.debug("Closing signal burst session failed: %s", err)
+
+    async def _async_run(self, interval, ready):
+        url = self.entry.data[CONF_URL]
+        connection = None
+        try:
+            try:
+                connection, client = await self._async_login()
+            except Exception as err:
+                ready.set_exception(HomeAssistantError(f"Could not start signal burst for {url}: {err}"))
+                return
+            ready.set_result(None)
+            _LOGGER.info("Signal burst started for %s", url)
+
+            errors = 0
+            while time.time() < self.ends_at:
+                started = time.monotonic()
+                try:
+                    if connection is None:
+                        connection, client = await self._async_login()
+                    signal = await self.hass.async_add_executor_job(client.device.signal)
+                except Exception as err:
+                    errors += 1
+                    _LOGGER.debug("Signal burst sample failed: %s", err)
+                    if errors >= MAX_CONSECUTIVE_ERRORS:
+                        _LOGGER.error("Signal burst stopped after %d failed samples: %s", errors, err)
+                        break
+                    # The coordinator's own login can invalidate this session, log in again.
+                    if connection is not None:
+                        await self._async_close(connection)
+                        connection = None
+                else:
+                    errors = 0
+                    self.samples.append(
+                        (time.time(), {m: parse_signal_value(signal.get(m)) for m in SIGNAL_METRICS})
+                    )
+                    async_dispatcher_send(self.hass, burst_signal_name(self.entry.entry_id))
+                await asyncio.sleep(max(0, interval - (time.monotonic() - started)))
+        finally:
+            if not ready.done():
+                ready.set_result(None)
+            # Release the slot before awaiting so a new burst can start meanwhile.
+            if self._task is asyncio.current_task():
+                self._task = None
+                self.ends_at = None
+            async_dispatcher_send(self.hass, burst_signal_name(self.entry.entry_id))
+            if connection is not None:
+                await self._async_close(connection)
+                _LOGGER.info("Signal burst finished for %s", url)
+
+    def statistics(self):
+        """Return min/max/mean and trend (units per minute) for each metric."""
+        stats = {}
+        for metric in SIGNAL_METRICS:
+            points = [(ts, values[metric]) for ts, values in self.samples if values[metric] is not None]
+            if not points:
+                continue
+            readings = [v for _, v in points]
+            stats[metric] = {
+                "latest": readings[-1],
+                "min": min(readings),
+                "max": max(readings),
+                "mean": round(sum(readings) / len(readings), 2),
+                "trend": _slope_per_minute(points),
+            }
+        return stats
+
+
+def _slope_per_minute(points):
+    """Least-squares slope of the readings over time, per minute."""
+    if len(points) < 2:
+        return 0.0
+    t0 = points[0][0]
+    xs = [ts - t0 for ts, _ in points]
+    ys = [v for _, v in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    if not var_x:
+        return 0.0
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    return round(cov / var_x * 60, 3)
@@ -1,9 +1,8 @@
 from __future__ import annotations
 import logging
 from homeassistant.components.button import ButtonEntity
-from huawei_lte_api.Client import Client
-from huawei_lte_api.Connection import Connection
-from . import DOMAIN, create_session
+from .api import get_client, get_connection
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,14 +34,8 @@ class RouterRebootButton(ButtonEntity):
     async def async_press(self) -> None:
         """Handle the button press."""
         def _reboot():
-            url = self._config["url"]
-            username = self._config["username"]
-            password = self._config["password"]
-            scheme, host = url.split("://", 1) if "://" in url else ("http", url)
-            
-            session = create_session()
-            with Connection(f"{scheme}://{username}:{password}@{host}/", requests_session=session) as connection:
-                client = Client(connection)
+            with get_connection(self._config) as connection:
+                client = get_client(connection)
                 client.device.reboot()
         
         await self.hass.async_add_executor_job(_reboot)
\ No newline at end of file
@@ -1,25 +1,115 @@
 from __future__ import annotations
+import logging
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
-from . import DOMAIN, CONF_URL, CONF_USERNAME, CONF_PASSWORD
+from .api import CannotConnect, InvalidAuth, TooManyAttempts, split_url, validate_login
+from .const import DOMAIN, CONF_URL, CONF_USERNAME, CONF_PASSWORD
+from .discovery import async_discover_routers
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_USERNAME = "admin"
+
+
+def _normalize_url(url):
+    """Return the URL with an explicit scheme and without a trailing slash."""
+    url = url.strip().rstrip("/")
+    scheme, host = split_url(url)
+    return f"{scheme.lower()}://{host.lower()}"
+
+
+def _host_key(url):
+    """Return the host (and non-default port) a URL points at, ignoring the scheme."""
+    _, host = split_url(url.strip())
+    host = host.split("/", 1)[0].rsplit("@", 1)[-1].lower()
+    for default_port in (":80", ":443"):
+        if host.endswith(default_port):
+            return host[: -len(default_port)]
+    return host
+
 
 class HuaweiServiceSyncConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Huawei Service Sync."""
     VERSION = 1
 
+    def __init__(self):
+        self._discovered = None
+        self._discovery_task = None
+
+    def _configured_hosts(self):
+        """Return the hosts of the existing entries, old ones included."""
+        return {
+            _host_key(entry.data[CONF_URL])
+            for entry in self._async_current_entries(include_ignore=False)
+        }
+
+    async def _async_discover(self):
+        try:
+            return await async_discover_routers(self.hass, self._configured_hosts())
+        except Exception:
+            _LOGGER.exception("Router discovery failed")
+            return []
+
+    async def async_step_discover(self, user_input=None):
+        """Search the LAN for routers while showing a progress spinner."""
+        if self._discovery_task is None:
+            self._discovery_task = self.hass.async_create_task(self._async_discover())
+        if not self._discovery_task.done():
+            return self.async_show_progress(
+                step_id="discover",
+                progress_action="discover",
+                progress_task=self._discovery_task,
+            )
+        self._discovered = self._discovery_task.result()
+        return self.async_show_progress_done(next_step_id="user")
+
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
+        if self._discovered is None:
+            return await self.async_step_discover()
+
+        errors = {}
         if user_input is not None:
-            return self.async_create_entry(title="Huawei Router", data=user_input)
+            url = _normalize_url(user_input[CONF_URL])
+            host = _host_key(url)
+            await self.async_set_unique_id(host)
+            self._abort_if_unique_id_configured()
+            if host in self._configured_hosts():
+                return self.async_abort(reason="already_configured")
+
+            try:
+                device_name = await self.hass.async_add_executor_job(
+                    validate_login, {**user_input, CONF_URL: url}
+                )
+            except InvalidAuth:
+                errors["base"] = "invalid_auth"
+            except TooManyAttempts:
+                errors["base"] = "too_many_attempts"
+            except CannotConnect:
+                errors["base"] = "cannot_connect"
+            except Exception:
+                _LOGGER.exception("Unexpected error validating %s", url)
+                errors["base"] = "unknown"
+            else:
+                return self.async_create_entry(
+                    title=device_name or "Huawei Router",
+                    data={**user_input, CONF_URL: url},
+                )
 
+        user_input = user_input or {}
+        default_url = user_input.get(CONF_URL) or next(iter(self._discovered), "")
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema({
-                vol.Required(CONF_URL): str,
-                vol.Required(CONF_USERNAME): str,
+                vol.Required(CONF_URL, default=default_url): str,
+                vol.Required(CONF_USERNAME, default=user_input.get(CONF_USERNAME, DEFAULT_USERNAME)): str,
                 vol.Required(CONF_PASSWORD): str,
-            })
+            }),
+            errors=errors,
+            description_placeholders={
+                "discovered": ", ".join(self._discovered) or "none",
+            },
         )
     
     @staticmethod
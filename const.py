@@ -0,0 +1,8 @@
+"""Constants for the Huawei Router Service integration."""
+
+# The domain of your component. Should be equal to the name of your component.
+DOMAIN = "huawei_service_sync"
+
+CONF_URL = "url"
+CONF_USERNAME = "username"
+CONF_PASSWORD = "password"
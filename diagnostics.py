@@ -0,0 +1,32 @@
+"""Diagnostics support for Huawei Router Service."""
+from __future__ import annotations
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import api
+from .const import CONF_PASSWORD, DOMAIN
+
+TO_REDACT = {CONF_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Return diagnostics, including the startup timing report, for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "setup_timings": coordinator.setup_timings,
+        # Paid once per Home Assistant process, by whichever entry loads first.
+        "integration_import_ms": (
+            round(api.integration_import_duration * 1000, 1)
+            if api.integration_import_duration is not None
+            else None
+        ),
+        "client_import_ms": (
+            round(api.client_import_duration * 1000, 1)
+            if api.client_import_duration is not None
+            else None
+        ),
+        "last_update_success": coordinator.last_update_success,
+    }
@@ -0,0 +1,119 @@
+"""LAN discovery of Huawei routers for the config flow."""
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+_LOGGER = logging.getLogger(__name__)
+
+# Addresses Huawei LTE/5G routers ship with, probed before anything else.
+DEFAULT_GATEWAYS = ("192.168.8.1", "192.168.1.1", "192.168.0.1", "192.168.3.1")
+
+# Endpoint served without authentication by the Huawei web API.
+PROBE_PATH = "/api/webserver/SesTokInfo"
+PROBE_TIMEOUT = 1.5
+MAX_CONCURRENT_PROBES = 32
+# Upper bound for sweeping the local subnets when no gateway answered.
+SWEEP_TIMEOUT = 8
+
+
+async def _async_local_networks(hass: HomeAssistant) -> list[ipaddress.IPv4Network]:
+    """Return the /24 networks of the enabled local IPv4 adapters."""
+    try:
+        from homeassistant.components import network
+    except ImportError:
+        return []
+
+    networks = []
+    try:
+        adapters = await network.async_get_adapters(hass)
+    except Exception as err:
+        _LOGGER.debug("Could not list network adapters: %s", err)
+        return []
+
+    for adapter in adapters:
+        if not adapter.get("enabled"):
+            continue
+        for ipv4 in adapter.get("ipv4", []):
+            address = ipaddress.IPv4Address(ipv4["address"])
+            if address.is_loopback or address.is_link_local:
+                continue
+            # Never sweep more than a /24, even on larger networks.
+            prefix = max(ipv4.get("network_prefix", 24), 24)
+            networks.append(ipaddress.IPv4Network(f"{address}/{prefix}", strict=False))
+    return networks
+
+
+def _gateway_hosts(networks: list[ipaddress.IPv4Network]) -> list[str]:
+    """Return the well-known gateways and the first host of each local network."""
+    candidates = list(DEFAULT_GATEWAYS)
+    candidates.extend(str(next(net.hosts())) for net in networks if net.num_addresses > 2)
+    return list(dict.fromkeys(candidates))
+
+
+def _subnet_hosts(networks: list[ipaddress.IPv4Network], skip: list[str]) -> list[str]:
+    """Return every other host of the local networks, without duplicates."""
+    skip = set(skip)
+    candidates = (str(host) for net in networks for host in net.hosts())
+    return [host for host in dict.fromkeys(candidates) if host not in skip]
+
+
+async def _async_probe(
+    session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, host: str
+) -> bool:
+    """Return True if a Huawei web API answers on the given host."""
+    async with semaphore:
+        try:
+            async with session.get(
+                f"http://{host}{PROBE_PATH}",
+                timeout=aiohttp.ClientTimeout(total=PROBE_TIMEOUT),
+                allow_redirects=False,
+            ) as response:
+                if response.status != 200:
+                    return False
+                body = await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError):
+            return False
+    return "<SesInfo>" in body or "<TokInfo>" in body
+
+
+async def _async_probe_hosts(
+    session: aiohttp.ClientSession, hosts: list[str], found: list[str]
+) -> None:
+    """Probe hosts concurrently, appending each router to found as it answers."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
+
+    async def _probe(host: str) -> None:
+        if await _async_probe(session, semaphore, host):
+            found.append(host)
+
+    await asyncio.gather(*(_probe(host) for host in hosts))
+
+
+async def async_discover_routers(hass: HomeAssistant, configured: set[str]) -> list[str]:
+    """Probe gateway addresses, then local subnets, return new router URLs found.
+
+    Hosts in configured are never probed. The subnet sweep only runs when no
+    new router answered on a gateway address and is cut off after
+    SWEEP_TIMEOUT seconds, keeping whatever was found until then.
+    """
+    networks = await _async_local_networks(hass)
+    session = async_get_clientsession(hass, verify_ssl=False)
+    gateways = [host for host in _gateway_hosts(networks) if host not in configured]
+    found = []
+
+    await _async_probe_hosts(session, gateways, found)
+    if not found:
+        try:
+            async with asyncio.timeout(SWEEP_TIMEOUT):
+                await _async_probe_hosts(session, _subnet_hosts(networks, [*gateways, *configured]), found)
+        except TimeoutError:
+            _LOGGER.debug("Subnet sweep stopped after %s s", SWEEP_TIMEOUT)
+
+    _LOGGER.debug("Found Huawei routers at %s", found)
+    return [f"http://{host}" for host in found]
@@ -0,0 +1,135 @@
+"""On-demand profiling of coordinator refreshes and entity state writes."""
+from __future__ import annotations
+
+import cProfile
+from contextlib import contextmanager
+import io
+import logging
+import pstats
+import threading
+import time
+import tracemalloc
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import CONF_URL, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+
+
+class RefreshProfiler:
+    """Collect CPU profiles and allocation snapshots over N refreshes."""
+
+    def __init__(self, hass: HomeAssistant, entry, refreshes, trace_allocations=True):
+        self.hass = hass
+        self.entry = entry
+        self.remaining = refreshes
+        self.refreshes = refreshes
+        self.durations = []
+        self._profiles = []
+        self._trace_allocations = trace_allocations
+        self._started_tracing = False
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._reported = False
+        # Unsubscribe callback of the overall deadline, set by the service.
+        self.cancel_deadline = None
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        self.path = hass.config.path(f"{DOMAIN}_profile_{entry.entry_id}_{stamp}")
+
+    def start(self):
+        """Start allocation tracing and take the baseline snapshot."""
+        with self._lock:
+            # The report may already be written if the entry went away meanwhile.
+            if not self._trace_allocations or self._reported:
+                return
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            self._snapshot = tracemalloc.take_snapshot()
+
+    @contextmanager
+    def profile(self):
+        """Profile the enclosed block and keep the result."""
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler (e.g. HA's own profiler integration) is active.
+            yield
+            return
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._profiles.append(profile)
+
+    def wrap(self, func):
+        """Return func profiled when it runs, for executor jobs."""
+        def _profiled(*args):
+            with self.profile():
+                return func(*args)
+        return _profiled
+
+    @callback
+    def async_refresh_done(self):
+        """Count a finished refresh, return True once the last one is done."""
+        self.remaining -= 1
+        return self.remaining <= 0
+
+    async def async_finish(self):
+        """Write the report and tell the user where it is."""
+        path = await self.hass.async_add_executor_job(self._write_report)
+        _LOGGER.info("Profile of %d refreshes written to %s", len(self.durations), path)
+        await self.hass.services.async_call(
+            "persistent_notification", "create",
+            {"title": "Huawei Router Profile", "message": f"Profile written to {path}"}
+        )
+
+    def _write_report(self):
+        with self._lock:
+            self._reported = True
+            return self._write_report_locked()
+
+    def _write_report_locked(self):
+        out = io.StringIO()
+        out.write(f"Router: {self.entry.data[CONF_URL]}\n")
+        out.write(f"Refreshes: {len(self.durations)} of {self.refreshes} requested\n")
+        if self.durations:
+            out.write(
+                "_async_update_data durations (ms): "
+                + ", ".join(f"{d * 1000:.1f}" for d in self.durations)
+                + f" (mean {sum(self.durations) / len(self.durations) * 1000:.1f})\n"
+            )
+
+        if self._profiles:
+            stats = pstats.Stats(*self._profiles, stream=out)
+            stats.dump_stats(f"{self.path}.prof")
+            out.write(
+                "\nNote: on Python 3.12+ cProfile hooks the whole interpreter, so the\n"
+                "profiles below can include the event loop and other threads that ran\n"
+                "while the router fetch was in flight, not only this integration.\n"
+            )
+            out.write("\n=== CPU by cumulative time ===\n")
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+            out.write("\n=== CPU by own time ===\n")
+            stats.sort_stats(pstats.SortKey.TIME).print_stats(TOP_FUNCTIONS)
+        else:
+            out.write("\nNo CPU profile captured (another profiler was active).\n")
+
+        if self._snapshot is not None:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            if self._started_tracing:
+                tracemalloc.stop()
+            out.write(f"\n=== Allocations (current {current} B, peak {peak} B) ===\n")
+            for stat in snapshot.compare_to(self._snapshot, "lineno")[:TOP_ALLOCATIONS]:
+                out.write(f"{stat}\n")
+
+        path = f"{self.path}.txt"
+        with open(path, "w", encoding="utf-8") as report:
+            report.write(out.getvalue())
+        return path
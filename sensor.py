@@ -2,20 +2,17 @@
 from __future__ import annotations
 
 import logging
-import requests
 
-from huawei_lte_api.Client import Client
-from huawei_lte_api.Connection import Connection
 from homeassistant.components.sensor import (
     SensorEntity,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
-from . import DOMAIN, create_session
-
-requests.packages.urllib3.disable_warnings()
+from .burst import SIGNAL_METRICS, burst_signal_name, parse_signal_value
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,6 +39,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
         RouterSignalQuality(coordinator, config),
         RouterTrafficStatistics(coordinator, config),
         RouterConnectedDevices(coordinator, config),
+        RouterSignalBurst(coordinator, config),
     ])
 
 class LocalRouter(CoordinatorEntity, SensorEntity):
@@ -235,12 +233,8 @@ class RouterSignalQuality(CoordinatorEntity, SensorEntity):
         }
 
     def _get_quality(self, metric, value):
-        if value is None:
-            return "Unknown"
-        try:
-            v_str = str(value).upper().replace('DBM', '').replace('DB', '').replace('>=', '').strip()
-            v = float(v_str)
-        except ValueError:
+        v = parse_signal_value(value)
+        if v is None:
             return "Unknown"
 
         if metric == 'rssi':
@@ -265,6 +259,75 @@ class RouterSignalQuality(CoordinatorEntity, SensorEntity):
             return "Poor"
         return "Unknown"
 
+class RouterSignalBurst(CoordinatorEntity, SensorEntity):
+    """Representation of the live signal burst used for antenna alignment."""
+
+    _attr_name = "Router Signal Burst"
+    _attr_icon = "mdi:antenna"
+    _attr_native_unit_of_measurement = "dBm"
+    # Rewritten once per second during a burst, keep them out of the recorder.
+    _unrecorded_attributes = frozenset(
+        {"samples"}
+        | {
+            f"{metric}_{name}"
+            for metric in SIGNAL_METRICS
+            for name in ("latest", "min", "max", "mean", "trend")
+        }
+    )
+
+    def __init__(self, coordinator, config):
+        super().__init__(coordinator)
+        self._config = config
+        self._update_from_burst()
+
+    @property
+    def unique_id(self):
+        return f"{self._config['url']}_signal_burst"
+
+    @property
+    def device_info(self):
+        return {
+            "identifiers": {(DOMAIN, self._config["url"])},
+            "name": "Huawei Router",
+            "manufacturer": "Huawei",
+            "model": "LTE",
+        }
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                burst_signal_name(self.coordinator.entry.entry_id),
+                self._handle_burst_sample,
+            )
+        )
+
+    @callback
+    def _handle_burst_sample(self):
+        self._update_from_burst()
+        self.async_write_ha_state()
+
+    def _update_from_burst(self):
+        """Compute the burst statistics once per sample."""
+        burst = self.coordinator.signal_burst
+        statistics = burst.statistics()
+        attributes = {
+            "active": burst.active,
+            "ends_at": burst.ends_at,
+            "samples": len(burst.samples),
+        }
+        for metric, stats in statistics.items():
+            for name, value in stats.items():
+                attributes[f"{metric}_{name}"] = value
+        self._attr_native_value = statistics.get("rsrp", {}).get("latest")
+        self._attr_extra_state_attributes = attributes
+
+    @property
+    def available(self):
+        # Burst samples keep coming even when the regular poll fails.
+        return self.coordinator.signal_burst.active or super().available
+
 class RouterSignalSensor(CoordinatorEntity, SensorEntity):
     """Representation of a Signal Sensor."""
 
@@ -2,9 +2,8 @@ from __future__ import annotations
 import logging
 from homeassistant.components.text import TextEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from huawei_lte_api.Client import Client
-from huawei_lte_api.Connection import Connection
-from . import DOMAIN, create_session
+from .api import get_client, get_connection
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,18 +30,10 @@ class RouterDNSEntity(CoordinatorEntity, TextEntity):
             "model": "LTE",
         }
 
-    def _get_connection(self):
-        url = self._config["url"]
-        username = self._config["username"]
-        password = self._config["password"]
-        scheme, host = url.split("://", 1) if "://" in url else ("http", url)
-        session = create_session()
-        return Connection(f"{scheme}://{username}:{password}@{host}/", requests_session=session)
-
     async def _async_update_settings(self, primary=None, secondary=None):
         def _do_update():
-            with self._get_connection() as connection:
-                client = Client(connection)
+            with get_connection(self._config) as connection:
+                client = get_client(connection)
                 # Fetch current to get IP and existing values
                 current = client.dhcp.settings()
                 router_ip = current.get('DhcpIPAddress')